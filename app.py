@@ -3,16 +3,39 @@ CORD-19 Data Explorer - Streamlit Application
 Interactive web application for exploring COVID-19 research data.
 """
 
+import hashlib
+import io
+import os
 import streamlit as st
 import pandas as pd
-import matplotlib.pyplot as plt
-import seaborn as sns
-from wordcloud import WordCloud
 import plotly.express as px
 import plotly.graph_objects as go
-from collections import Counter
-import re
 import numpy as np
+import pyarrow as pa
+import pyarrow.compute as pc
+
+# Splits text into words on runs of non-word characters; the Unicode-aware
+# equivalent of r'\W+'. Built once and shared by every tokenization call.
+WORD_SPLIT_OPTIONS = pc.SplitPatternOptions(pattern=r'[^\pL\pN_]+')
+
+# Common words excluded from title word frequencies
+STOP_WORDS = frozenset({
+    'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 'of', 'with', 'by',
+    'is', 'are', 'was', 'were', 'be', 'been', 'have', 'has', 'had', 'do', 'does', 'did',
+    'will', 'would', 'could', 'should', 'may', 'might', 'can', 'this', 'that', 'these', 'those'
+})
+STOP_WORDS_ARRAY = pa.array(sorted(STOP_WORDS), type=pa.string())
+
+# A run of characters str.split() would keep together as one word, in the RE2
+# syntax used by Arrow-backed string columns
+NON_SPACE_RUN = r'[^\pZ\t\n\v\f\r\x{1c}-\x{1f}\x{85}]+'
+
+# Raw metadata and the cleaned, typed copy generated from it
+CSV_PATH = 'data/sample_metadata.csv'
+PARQUET_PATH = 'data/sample_metadata.parquet'
+
+# Longest series the timeline sends to the browser before it is downsampled
+MAX_TIMELINE_POINTS = 500
 
 # Page configuration
 st.set_page_config(
@@ -43,44 +66,364 @@ st.markdown("""
 </style>
 """, unsafe_allow_html=True)
 
-@st.cache_data
-def load_data():
-    """Load and cache the dataset."""
+def read_cleaned_data():
+    """Read the cleaned dataset, regenerating its Parquet copy when the CSV is newer.
+
+    An existing Parquet file is used as is when the CSV is absent. If the copy
+    can't be written, e.g. on a read-only deploy, the freshly cleaned frame is
+    returned from memory instead.
+    """
+    if os.path.exists(PARQUET_PATH) and (
+            not os.path.exists(CSV_PATH) or
+            os.path.getmtime(PARQUET_PATH) >= os.path.getmtime(CSV_PATH)):
+        return pd.read_parquet(PARQUET_PATH, engine='pyarrow')
+    
+    # Read text straight into Arrow-backed string columns
+    df = pd.read_csv(CSV_PATH, engine='pyarrow', dtype_backend='pyarrow')
+    # Clean the data
+    df['publish_time'] = pd.to_datetime(df['publish_time'], errors='coerce')
+    df['year'] = df['publish_time'].dt.year.astype('Int16')
+    df['journal'] = df['journal'].astype('category')
+    df['source'] = df['source'].astype('category')
+    df['abstract_word_count'] = df['abstract'].str.count(NON_SPACE_RUN).fillna(0).astype('int32')
+    df['title_word_count'] = df['title'].str.count(NON_SPACE_RUN).fillna(0).astype('int32')
+    
+    # Write to a temporary file first so a concurrent reader never sees a partial file
+    tmp_path = PARQUET_PATH + '.tmp'
     try:
-        df = pd.read_csv('data/sample_metadata.csv')
-        # Clean the data
-        df['publish_time'] = pd.to_datetime(df['publish_time'], errors='coerce')
-        df['year'] = df['publish_time'].dt.year
-        df['abstract_word_count'] = df['abstract'].apply(
-            lambda x: len(str(x).split()) if pd.notna(x) and x != '' else 0
-        )
-        df['title_word_count'] = df['title'].apply(
-            lambda x: len(str(x).split()) if pd.notna(x) and x != '' else 0
-        )
+        df.to_parquet(tmp_path, engine='pyarrow', compression='zstd', index=False)
+        os.replace(tmp_path, PARQUET_PATH)
+    except OSError:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
         return df
+    return pd.read_parquet(PARQUET_PATH, engine='pyarrow')
+
+@st.cache_resource
+def load_data():
+    """Load the dataset once per process.
+
+    The same frame is shared by every session, so it must never be modified;
+    take filtered views of it with ``select_rows``.
+    """
+    try:
+        return read_cleaned_data()
     except FileNotFoundError:
         st.error("Data file not found. Please ensure 'data/sample_metadata.csv' exists.")
         return None
 
-def create_word_cloud(text):
-    """Create a word cloud from text."""
-    if not text or text.strip() == '':
-        return None
+@st.cache_resource
+def search_arrays():
+    """Arrow copies of the title and abstract columns, shared by all sessions.
+
+    Element ``i`` belongs to row ``i`` of the frame returned by ``load_data``.
+    """
+    df = load_data()
+    arrays = []
+    for column in ('title', 'abstract'):
+        array = pa.array(df[column].fillna(''), type=pa.string())
+        # Chunked Arrow-backed columns come back as a ChunkedArray; the index needs one array
+        if isinstance(array, pa.ChunkedArray):
+            array = array.combine_chunks()
+        arrays.append(array)
+    return tuple(arrays)
+
+def count_words(titles):
+    """Count title words, skipping stop words and words of two letters or fewer.
+
+    Returns the vocabulary and the matching word counts as numpy arrays.
+    """
+    titles = pa.array(titles, type=pa.string(), from_pandas=True)
+    words = pc.list_flatten(pc.split_pattern_regex(pc.utf8_lower(titles), options=WORD_SPLIT_OPTIONS))
     
-    # Clean and prepare text
-    words = re.findall(r'\b\w+\b', text.lower())
-    stop_words = {'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 'of', 'with', 'by', 
-                  'is', 'are', 'was', 'were', 'be', 'been', 'have', 'has', 'had', 'do', 'does', 'did', 
-                  'will', 'would', 'could', 'should', 'may', 'might', 'can', 'this', 'that', 'these', 'those'}
-    words = [word for word in words if word not in stop_words and len(word) > 2]
+    # Count each distinct word in a single pass
+    word_counts = pc.value_counts(words)
+    vocab = word_counts.field('values')
     
-    if not words:
+    # Stop words are filtered once per distinct word rather than per occurrence;
+    # the length check also drops the empty strings left by leading separators
+    keep = pc.and_(
+        pc.invert(pc.is_in(vocab, value_set=STOP_WORDS_ARRAY)),
+        pc.greater(pc.utf8_length(vocab), 2)
+    )
+    return (
+        vocab.filter(keep).to_numpy(zero_copy_only=False),
+        word_counts.field('counts').filter(keep).to_numpy()
+    )
+
+def category_mask(column, selected):
+    """Flag the rows of a categorical column whose value is in ``selected``.
+
+    Compares the small integer category codes instead of the strings.
+    """
+    selected_codes = column.cat.categories.get_indexer(list(selected))
+    return np.isin(column.cat.codes.to_numpy(), selected_codes)
+
+def most_common_words(vocab, counts, n):
+    """Return the ``n`` most frequent words as (word, count) pairs, most frequent first.
+
+    Partitions the counts instead of sorting the whole vocabulary; ties keep
+    the order in which the words first appeared.
+    """
+    if len(counts) > n:
+        # Everything above the n-th largest count, then the earliest words tied with it
+        kth = np.partition(counts, -n)[-n]
+        above = np.flatnonzero(counts > kth)
+        tied = np.flatnonzero(counts == kth)[:n - len(above)]
+        top = np.concatenate([above, tied])
+    else:
+        top = np.arange(len(counts))
+    top = top[np.lexsort((top, -counts[top]))]
+    return [(str(vocab[i]), int(counts[i])) for i in top]
+
+@st.cache_data(max_entries=32, ttl="1h")
+def filter_rows(years, journals, sources):
+    """Positions of the papers matching the chosen years, journals and sources."""
+    df = load_data()
+    mask = (
+        df['year'].isin(years).to_numpy(dtype=bool) &
+        category_mask(df['journal'], journals) &
+        category_mask(df['source'], sources)
+    )
+    return np.flatnonzero(mask)
+
+def select_rows(df, rows):
+    """Take the given rows of the dataset as a new frame."""
+    filtered_df = df.iloc[rows]
+    
+    # Drop categories with no remaining papers so counts and charts only show selected values
+    return filtered_df.assign(
+        journal=filtered_df['journal'].cat.remove_unused_categories(),
+        source=filtered_df['source'].cat.remove_unused_categories()
+    )
+
+@st.cache_data(max_entries=32, ttl="1h")
+def title_word_counts(years, journals, sources):
+    """Count title words for a filter selection, cached per selection."""
+    return count_words(load_data()['title'].take(filter_rows(years, journals, sources)))
+
+def create_word_cloud(frequencies):
+    """Create a word cloud from a mapping of words to counts."""
+    if not frequencies:
         return None
     
+    # Imported here so the rest of the app doesn't wait on it at startup
+    from wordcloud import WordCloud
     wordcloud = WordCloud(width=800, height=400, background_color='white', 
-                         max_words=100, colormap='viridis').generate(' '.join(words))
+                         max_words=100, colormap='viridis').generate_from_frequencies(frequencies)
     return wordcloud
 
+def lttb_indices(x, y, n_out):
+    """Pick the indices of ``n_out`` points that best preserve the shape of a series.
+
+    Uses Largest-Triangle-Three-Buckets: the first and last points are kept and
+    each bucket in between contributes the point forming the largest triangle
+    with the previously kept point and the average of the next bucket.
+    """
+    n = len(y)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+    
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    edges = np.linspace(1, n - 1, n_out - 1).astype(int)
+    indices = np.empty(n_out, dtype=int)
+    indices[0], indices[-1] = 0, n - 1
+    
+    previous = 0
+    for i in range(n_out - 2):
+        start, end = edges[i], edges[i + 1]
+        if i + 2 < len(edges):
+            next_x = x[end:edges[i + 2]].mean()
+            next_y = y[end:edges[i + 2]].mean()
+        else:
+            next_x, next_y = x[-1], y[-1]
+        
+        areas = np.abs(
+            (x[previous] - next_x) * (y[start:end] - y[previous]) -
+            (x[previous] - x[start:end]) * (next_y - y[previous])
+        )
+        previous = start + int(np.argmax(areas))
+        indices[i + 1] = previous
+    return indices
+
+@st.cache_data(max_entries=32, ttl="1h")
+def word_cloud_items(years, journals, sources):
+    """Top 100 title words for the word cloud of a filter selection.
+
+    Also leaves out WordCloud's own stop words, which ``generate`` would have
+    dropped from raw text but ``generate_from_frequencies`` does not.
+    """
+    from wordcloud import STOPWORDS
+    vocab, counts = title_word_counts(years, journals, sources)
+    keep = ~np.isin(vocab, sorted(STOPWORDS))
+    return tuple(most_common_words(vocab[keep], counts[keep], 100))
+
+@st.cache_data(max_entries=8)
+def serialize_csv(rows_digest, _rows):
+    """Serialize the given dataset rows to CSV bytes, cached per set of rows.
+
+    Streamlit only samples large arrays when hashing arguments, so the rows are
+    left unhashed and the cache is keyed on ``rows_digest``, a digest of all of them.
+    """
+    return load_data().iloc[_rows].to_csv(index=False).encode('utf-8')
+
+@st.cache_data(max_entries=16)
+def wordcloud_png(top_items):
+    """Render the word cloud for a tuple of (word, count) pairs as PNG bytes."""
+    wordcloud = create_word_cloud(dict(top_items))
+    if wordcloud is None:
+        return None
+    
+    import matplotlib.pyplot as plt
+    fig, ax = plt.subplots(figsize=(12, 6))
+    ax.imshow(wordcloud, interpolation='bilinear')
+    ax.axis('off')
+    ax.set_title('Word Cloud of Research Paper Titles', fontsize=16, fontweight='bold')
+    buf = io.BytesIO()
+    fig.savefig(buf, format='png', bbox_inches='tight')
+    plt.close(fig)
+    return buf.getvalue()
+
+@st.cache_resource
+def search_index():
+    """Inverted index from each title word to the rows containing it.
+
+    Returns the distinct words as an Arrow array, the offset of each word's
+    postings, and the concatenated row positions of all postings.
+    """
+    titles, _ = search_arrays()
+    words = pc.split_pattern_regex(pc.utf8_lower(titles), options=WORD_SPLIT_OPTIONS)
+    rows = pc.list_parent_indices(words).to_numpy()
+    encoded = pc.list_flatten(words).dictionary_encode()
+    
+    # One posting per (word, row) pair, sorted by word and then by row
+    keys = np.unique(encoded.indices.to_numpy().astype(np.int64) * len(titles) + rows)
+    ids, rows = np.divmod(keys, len(titles))
+    offsets = np.searchsorted(ids, np.arange(len(encoded.dictionary) + 1))
+    return encoded.dictionary, offsets, rows.astype(np.int32)
+
+def title_search_mask(term, limit):
+    """Flag the rows whose title contains the single word ``term``, ignoring case.
+
+    A word can only occur inside one token, so the matching rows are the postings
+    of every indexed word containing ``term``. Returns None when those postings
+    outnumber ``limit``, where scanning the titles is cheaper.
+    """
+    vocab, offsets, rows = search_index()
+    matches = np.flatnonzero(
+        pc.match_substring(vocab, term, ignore_case=True).to_numpy(zero_copy_only=False)
+    )
+    if (offsets[matches + 1] - offsets[matches]).sum() > limit:
+        return None
+    
+    mask = np.zeros(len(search_arrays()[0]), dtype=bool)
+    for i in matches:
+        mask[rows[offsets[i]:offsets[i + 1]]] = True
+    return mask
+
+@st.fragment
+def text_analysis_panel(filtered_df, selection):
+    """Title word frequencies, word cloud and abstract length distribution for the filtered papers."""
+    st.header("🔤 Text Analysis")
+    
+    # Word frequency analysis
+    st.subheader("📝 Most Frequent Words in Titles")
+    
+    # Analyze word frequency
+    vocab, counts = title_word_counts(*selection)
+    
+    if len(vocab) > 0:
+        top_words = most_common_words(vocab, counts, 20)
+        
+        # Create bar chart
+        words_df = pd.DataFrame(top_words, columns=['Word', 'Count'])
+        fig = px.bar(
+            words_df,
+            x='Count',
+            y='Word',
+            orientation='h',
+            title="Top 20 Most Frequent Words in Titles",
+            labels={'Count': 'Frequency', 'Word': 'Word'}
+        )
+        fig.update_layout(yaxis={'categoryorder': 'total ascending'})
+        st.plotly_chart(fig, use_container_width=True)
+        
+        # Word cloud
+        st.subheader("☁️ Word Cloud")
+        # The cloud shows at most 100 words, so only those key the cached image
+        png = wordcloud_png(word_cloud_items(*selection))
+        if png:
+            st.image(png)
+    
+    # Abstract length distribution
+    st.subheader("📏 Abstract Length Distribution")
+    # Bin on the server so only the 20 bin counts are sent to the browser
+    counts, edges = np.histogram(filtered_df['abstract_word_count'].to_numpy(), bins=20)
+    fig = go.Figure(go.Bar(
+        x=(edges[:-1] + edges[1:]) / 2,
+        y=counts,
+        width=np.diff(edges)
+    ))
+    fig.update_layout(
+        title="Distribution of Abstract Word Count",
+        xaxis_title='Word Count',
+        yaxis_title='Frequency',
+        bargap=0
+    )
+    st.plotly_chart(fig, use_container_width=True)
+
+@st.fragment
+def data_table_panel(filtered_df):
+    """Searchable table of the filtered papers, rerun on its own when the search changes."""
+    st.header("📋 Data Table")
+    
+    # Display filtered data
+    st.subheader("📊 Filtered Dataset")
+    st.write(f"Showing {len(filtered_df)} papers")
+    
+    # Search functionality
+    search_term = st.text_input("🔍 Search in titles and abstracts:")
+    if search_term:
+        # load_data() returns a RangeIndex, so index labels are positions in the search arrays
+        rows = filtered_df.index.to_numpy()
+        titles, abstracts = search_arrays()
+        
+        # Titles are answered from the index for uncommon single words; anything else is scanned
+        title_mask = None
+        if search_term.replace('_', '').isalnum():
+            title_mask = title_search_mask(search_term, len(rows))
+        if title_mask is None:
+            title_mask = pc.match_substring(
+                titles.take(rows), search_term, ignore_case=True
+            ).to_numpy(zero_copy_only=False)
+        else:
+            title_mask = title_mask[rows]
+        abstract_mask = pc.match_substring(
+            abstracts.take(rows), search_term, ignore_case=True
+        ).to_numpy(zero_copy_only=False)
+        search_mask = title_mask | abstract_mask
+        filtered_df = filtered_df.iloc[np.flatnonzero(search_mask)]
+        st.write(f"Found {len(filtered_df)} papers matching '{search_term}'")
+    
+    # Display data
+    display_columns = ['title', 'authors', 'journal', 'publish_time', 'abstract_word_count']
+    st.dataframe(
+        filtered_df[display_columns],
+        use_container_width=True,
+        height=400
+    )
+    
+    # Download button; the CSV is only serialized again when the rows change
+    rows = filtered_df.index.to_numpy()
+    csv = serialize_csv(hashlib.blake2b(rows.tobytes()).hexdigest(), rows)
+    st.download_button(
+        label="📥 Download filtered data as CSV",
+        data=csv,
+        file_name=f"cord19_filtered_data_{pd.Timestamp.now().strftime('%Y%m%d_%H%M%S')}.csv",
+        mime="text/csv"
+    )
+
 def main():
     """Main Streamlit application."""
     
@@ -121,11 +464,8 @@ def main():
     )
     
     # Filter data based on selections
-    filtered_df = df[
-        (df['year'].isin(selected_years)) &
-        (df['journal'].isin(selected_journals)) &
-        (df['source'].isin(selected_sources))
-    ]
+    selection = (tuple(selected_years), tuple(selected_journals), tuple(selected_sources))
+    filtered_df = select_rows(df, filter_rows(*selection))
     
     # Main content tabs
     tab1, tab2, tab3, tab4, tab5 = st.tabs(["📊 Overview", "📈 Trends", "📚 Journals", "🔤 Text Analysis", "📋 Data Table"])
@@ -133,6 +473,9 @@ def main():
     with tab1:
         st.header("📊 Dataset Overview")
         
+        # Papers per year; the sorted index also gives the date range without rescanning the column
+        year_counts = filtered_df['year'].value_counts().sort_index()
+        
         # Key metrics
         col1, col2, col3, col4 = st.columns(4)
         
@@ -143,7 +486,10 @@ def main():
             st.metric("Unique Journals", filtered_df['journal'].nunique())
         
         with col3:
-            st.metric("Date Range", f"{filtered_df['year'].min()}-{filtered_df['year'].max()}")
+            if len(year_counts) > 0:
+                st.metric("Date Range", f"{year_counts.index[0]}-{year_counts.index[-1]}")
+            else:
+                st.metric("Date Range", "N/A")
         
         with col4:
             avg_abstract_length = filtered_df['abstract_word_count'].mean()
@@ -151,7 +497,6 @@ def main():
         
         # Publications by year chart
         st.subheader("📈 Publications by Year")
-        year_counts = filtered_df['year'].value_counts().sort_index()
         
         fig = px.bar(
             x=year_counts.index, 
@@ -185,13 +530,21 @@ def main():
         
         # Time series analysis
         st.subheader("📅 Publication Timeline")
-        monthly_data = filtered_df.groupby(filtered_df['publish_time'].dt.to_period('M')).size()
+        monthly_data = filtered_df['publish_time'].dt.to_period('M').value_counts().sort_index()
         
-        fig = px.line(
-            x=monthly_data.index.astype(str),
+        # Long timelines are downsampled so the browser only draws the visually significant points
+        keep = lttb_indices(monthly_data.index.asi8, monthly_data.values, MAX_TIMELINE_POINTS)
+        monthly_data = monthly_data.iloc[keep]
+        
+        fig = go.Figure(go.Scattergl(
+            x=monthly_data.index.to_timestamp(),
             y=monthly_data.values,
+            mode='lines'
+        ))
+        fig.update_layout(
             title="Monthly Publication Trends",
-            labels={'x': 'Month', 'y': 'Number of Publications'}
+            xaxis_title='Month',
+            yaxis_title='Number of Publications'
         )
         fig.update_xaxes(tickangle=45)
         st.plotly_chart(fig, use_container_width=True)
@@ -215,6 +568,13 @@ def main():
         st.subheader("📊 Journal Distribution")
         journal_dist = filtered_df['journal'].value_counts()
         
+        # Keep the ten largest journals and fold the long tail into one slice
+        if len(journal_dist) > 10:
+            journal_dist = pd.concat([
+                journal_dist.head(10),
+                pd.Series({'Other': journal_dist.iloc[10:].sum()})
+            ])
+        
         fig = px.pie(
             values=journal_dist.values,
             names=journal_dist.index,
@@ -224,102 +584,20 @@ def main():
         
         # Journal performance metrics
         st.subheader("📈 Journal Performance Metrics")
-        journal_metrics = filtered_df.groupby('journal').agg({
-            'title': 'count',
-            'abstract_word_count': 'mean',
-            'year': ['min', 'max']
+        journal_metrics = filtered_df.groupby('journal', observed=True, sort=False).agg(**{
+            'Paper Count': ('title', 'size'),
+            'Avg Abstract Length': ('abstract_word_count', 'mean'),
+            'First Year': ('year', 'min'),
+            'Last Year': ('year', 'max')
         }).round(2)
         
-        journal_metrics.columns = ['Paper Count', 'Avg Abstract Length', 'First Year', 'Last Year']
         st.dataframe(journal_metrics, use_container_width=True)
     
     with tab4:
-        st.header("🔤 Text Analysis")
-        
-        # Word frequency analysis
-        st.subheader("📝 Most Frequent Words in Titles")
-        
-        # Combine all titles
-        all_titles = ' '.join(filtered_df['title'].dropna().astype(str))
-        
-        # Analyze word frequency
-        words = re.findall(r'\b\w+\b', all_titles.lower())
-        stop_words = {'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 'of', 'with', 'by', 
-                      'is', 'are', 'was', 'were', 'be', 'been', 'have', 'has', 'had', 'do', 'does', 'did', 
-                      'will', 'would', 'could', 'should', 'may', 'might', 'can', 'this', 'that', 'these', 'those'}
-        words = [word for word in words if word not in stop_words and len(word) > 2]
-        
-        if words:
-            word_counts = Counter(words)
-            top_words = word_counts.most_common(20)
-            
-            # Create bar chart
-            words_df = pd.DataFrame(top_words, columns=['Word', 'Count'])
-            fig = px.bar(
-                words_df,
-                x='Count',
-                y='Word',
-                orientation='h',
-                title="Top 20 Most Frequent Words in Titles",
-                labels={'Count': 'Frequency', 'Word': 'Word'}
-            )
-            fig.update_layout(yaxis={'categoryorder': 'total ascending'})
-            st.plotly_chart(fig, use_container_width=True)
-            
-            # Word cloud
-            st.subheader("☁️ Word Cloud")
-            wordcloud = create_word_cloud(all_titles)
-            if wordcloud:
-                fig, ax = plt.subplots(figsize=(12, 6))
-                ax.imshow(wordcloud, interpolation='bilinear')
-                ax.axis('off')
-                ax.set_title('Word Cloud of Research Paper Titles', fontsize=16, fontweight='bold')
-                st.pyplot(fig)
-        
-        # Abstract length distribution
-        st.subheader("📏 Abstract Length Distribution")
-        fig = px.histogram(
-            filtered_df,
-            x='abstract_word_count',
-            nbins=20,
-            title="Distribution of Abstract Word Count",
-            labels={'abstract_word_count': 'Word Count', 'count': 'Frequency'}
-        )
-        st.plotly_chart(fig, use_container_width=True)
+        text_analysis_panel(filtered_df, selection)
     
     with tab5:
-        st.header("📋 Data Table")
-        
-        # Display filtered data
-        st.subheader("📊 Filtered Dataset")
-        st.write(f"Showing {len(filtered_df)} papers")
-        
-        # Search functionality
-        search_term = st.text_input("🔍 Search in titles and abstracts:")
-        if search_term:
-            search_mask = (
-                filtered_df['title'].str.contains(search_term, case=False, na=False) |
-                filtered_df['abstract'].str.contains(search_term, case=False, na=False)
-            )
-            filtered_df = filtered_df[search_mask]
-            st.write(f"Found {len(filtered_df)} papers matching '{search_term}'")
-        
-        # Display data
-        display_columns = ['title', 'authors', 'journal', 'publish_time', 'abstract_word_count']
-        st.dataframe(
-            filtered_df[display_columns],
-            use_container_width=True,
-            height=400
-        )
-        
-        # Download button
-        csv = filtered_df.to_csv(index=False)
-        st.download_button(
-            label="📥 Download filtered data as CSV",
-            data=csv,
-            file_name=f"cord19_filtered_data_{pd.Timestamp.now().strftime('%Y%m%d_%H%M%S')}.csv",
-            mime="text/csv"
-        )
+        data_table_panel(filtered_df)
     
     # Footer
     st.markdown("---")
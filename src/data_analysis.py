@@ -4,16 +4,47 @@ This script performs comprehensive analysis of the CORD-19 research dataset.
 """
 
 import pandas as pd
-import matplotlib.pyplot as plt
-import seaborn as sns
-from wordcloud import WordCloud
 import numpy as np
-from collections import Counter
-import re
+import pyarrow as pa
+import pyarrow.compute as pc
 
-# Set style for better visualizations
-plt.style.use('seaborn-v0_8')
-sns.set_palette("husl")
+# Title tokenizer: split on anything that isn't a letter, digit or underscore
+WORD_SPLIT_OPTIONS = pc.SplitPatternOptions(pattern=r'[^\pL\pN_]+')
+
+# Common words excluded from title word frequencies
+STOP_WORDS = frozenset({
+    'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 'of', 'with', 'by',
+    'is', 'are', 'was', 'were', 'be', 'been', 'have', 'has', 'had', 'do', 'does', 'did',
+    'will', 'would', 'could', 'should', 'may', 'might', 'can', 'this', 'that', 'these', 'those',
+    'i', 'you', 'he', 'she', 'it', 'we', 'they', 'me', 'him', 'her', 'us', 'them'
+})
+STOP_WORDS_ARRAY = pa.array(sorted(STOP_WORDS), type=pa.string())
+
+def most_common_words(vocab, counts, n):
+    """Return the top ``n`` (word, count) pairs in the same order as Counter.most_common."""
+    if len(counts) <= n:
+        top = np.arange(len(counts))
+    else:
+        # Words above the n-th largest count, plus the earliest words equal to it
+        kth = np.partition(counts, -n)[-n]
+        above = np.flatnonzero(counts > kth)
+        top = np.concatenate([above, np.flatnonzero(counts == kth)[:n - len(above)]])
+    top = top[np.lexsort((top, -counts[top]))]
+    return [(str(vocab[i]), int(counts[i])) for i in top]
+
+def load_pyplot():
+    """Import matplotlib and seaborn on first use and apply the report style.
+
+    Plotting libraries are imported lazily so scripts that only load and clean
+    the data don't pay for them.
+    """
+    import matplotlib.pyplot as plt
+    import seaborn as sns
+    
+    # Set style for better visualizations
+    plt.style.use('seaborn-v0_8')
+    sns.set_palette("husl")
+    return plt
 
 class CORD19Analyzer:
     """Class to handle CORD-19 dataset analysis."""
@@ -93,14 +124,16 @@ class CORD19Analyzer:
         
         # Create abstract word count
         print("Creating abstract word count...")
-        self.cleaned_df['abstract_word_count'] = self.cleaned_df['abstract'].apply(
-            lambda x: len(str(x).split()) if pd.notna(x) and x != '' else 0
+        self.cleaned_df['abstract_word_count'] = (
+            self.cleaned_df['abstract'].fillna('').astype(str)
+            .str.split().str.len().astype('int32')
         )
         
         # Create title word count
         print("Creating title word count...")
-        self.cleaned_df['title_word_count'] = self.cleaned_df['title'].apply(
-            lambda x: len(str(x).split()) if pd.notna(x) and x != '' else 0
+        self.cleaned_df['title_word_count'] = (
+            self.cleaned_df['title'].fillna('').astype(str)
+            .str.split().str.len().astype('int32')
         )
         
         # Remove rows with missing critical data
@@ -125,6 +158,7 @@ class CORD19Analyzer:
         print(year_counts)
         
         # Create visualization
+        plt = load_pyplot()
         plt.figure(figsize=(12, 6))
         year_counts.plot(kind='bar', color='skyblue', edgecolor='black')
         plt.title('Number of COVID-19 Publications by Year', fontsize=16, fontweight='bold')
@@ -150,6 +184,7 @@ class CORD19Analyzer:
         print(journal_counts)
         
         # Create visualization
+        plt = load_pyplot()
         plt.figure(figsize=(12, 8))
         journal_counts.plot(kind='barh', color='lightcoral', edgecolor='black')
         plt.title('Top 10 Journals Publishing COVID-19 Research', fontsize=16, fontweight='bold')
@@ -168,28 +203,38 @@ class CORD19Analyzer:
         print("WORD FREQUENCY ANALYSIS")
         print("="*50)
         
-        # Combine all titles
-        all_titles = ' '.join(self.cleaned_df['title'].dropna().astype(str))
+        # Lowercase and tokenize all titles
+        titles = pa.array(self.cleaned_df['title'], type=pa.string(), from_pandas=True)
+        words = pc.list_flatten(pc.split_pattern_regex(pc.utf8_lower(titles), options=WORD_SPLIT_OPTIONS))
         
-        # Clean and tokenize
-        words = re.findall(r'\b\w+\b', all_titles.lower())
+        # Tally each distinct word with Arrow
+        word_counts = pc.value_counts(words)
+        vocab = word_counts.field('values')
         
-        # Remove common stop words
-        stop_words = {'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 'of', 'with', 'by', 'is', 'are', 'was', 'were', 'be', 'been', 'have', 'has', 'had', 'do', 'does', 'did', 'will', 'would', 'could', 'should', 'may', 'might', 'can', 'this', 'that', 'these', 'those', 'i', 'you', 'he', 'she', 'it', 'we', 'they', 'me', 'him', 'her', 'us', 'them'}
-        words = [word for word in words if word not in stop_words and len(word) > 2]
+        # Drop stop words and words of two letters or fewer (including empty tokens)
+        keep = pc.and_(
+            pc.invert(pc.is_in(vocab, value_set=STOP_WORDS_ARRAY)),
+            pc.greater(pc.utf8_length(vocab), 2)
+        )
+        vocab = vocab.filter(keep).to_numpy(zero_copy_only=False)
+        counts = word_counts.field('counts').filter(keep).to_numpy()
         
-        # Count word frequency
-        word_counts = Counter(words)
-        top_words = word_counts.most_common(20)
+        # Word frequencies and the top 20 words
+        word_frequencies = dict(zip(vocab.tolist(), counts.tolist()))
+        top_words = most_common_words(vocab, counts, 20)
         
         print("Top 20 most frequent words in titles:")
         for word, count in top_words:
             print(f"{word}: {count}")
         
-        # Create word cloud
+        # Create word cloud, leaving out WordCloud's own stop words as generate() would
+        from wordcloud import WordCloud, STOPWORDS
+        cloud_frequencies = {word: count for word, count in word_frequencies.items()
+                             if word not in STOPWORDS}
+        plt = load_pyplot()
         plt.figure(figsize=(15, 8))
         wordcloud = WordCloud(width=800, height=400, background_color='white', 
-                            max_words=100, colormap='viridis').generate(all_titles)
+                            max_words=100, colormap='viridis').generate_from_frequencies(cloud_frequencies)
         plt.imshow(wordcloud, interpolation='bilinear')
         plt.axis('off')
         plt.title('Word Cloud of COVID-19 Research Paper Titles', fontsize=16, fontweight='bold')
@@ -211,6 +256,7 @@ class CORD19Analyzer:
         print(abstract_stats)
         
         # Create visualization
+        plt = load_pyplot()
         plt.figure(figsize=(12, 6))
         plt.hist(self.cleaned_df['abstract_word_count'], bins=20, color='lightgreen', 
                 edgecolor='black', alpha=0.7)
@@ -236,6 +282,7 @@ class CORD19Analyzer:
         print(source_counts)
         
         # Create visualization
+        plt = load_pyplot()
         plt.figure(figsize=(10, 6))
         source_counts.plot(kind='pie', autopct='%1.1f%%', startangle=90)
         plt.title('Distribution of Papers by Source', fontsize=16, fontweight='bold')